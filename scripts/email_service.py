@@ -13,12 +13,13 @@ Usage:
 import os
 import smtplib
 import csv
+import json
 import time
+import atexit
+import functools
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from itertools import islice
+from email.message import EmailMessage
 
 # Try to import python-dotenv, fall back to defaults if not available
 try:
@@ -28,8 +29,15 @@ except ImportError:
     print("Warning: python-dotenv not found. Using default configuration.")
 
 
+@functools.lru_cache(maxsize=1)
 def load_email_config():
-    """Load email configuration from environment variables."""
+    """
+    Load email configuration from environment variables.
+
+    Cached so callers that need the config more than once per process (the
+    production service checks the send interval before running analytics)
+    share one dict instead of re-reading the environment.
+    """
     config = {
         'SMTP_SERVER': os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
         'SMTP_PORT': int(os.getenv('SMTP_PORT', '587')),
@@ -81,31 +89,54 @@ def get_analytics_summary(analytics_file):
     if not os.path.exists(analytics_file):
         return "Analytics file not found."
     
+    # The analytics processor leaves a sidecar .meta file with the row
+    # count; when it is present and current, the CSV scan can stop after the
+    # preview rows
+    total_worlds = None
+    meta_path = analytics_file + '.meta'
     try:
-        with open(analytics_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            worlds = list(reader)
-        
-        if not worlds:
+        if os.path.getmtime(meta_path) >= os.path.getmtime(analytics_file):
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                total_worlds = int(json.load(meta_file)['total_worlds'])
+    except (OSError, ValueError, KeyError, TypeError):
+        total_worlds = None
+
+    try:
+        # The CSV is already sorted by average occupants, so the preview is
+        # just the first three data rows. Keep only those in memory; without
+        # a usable sidecar, count the rest without materializing them
+        # (csv.reader handles quoted newlines correctly, unlike a raw line
+        # count).
+        with open(analytics_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return "No world data available."
+
+            top_worlds = [dict(zip(header, row)) for row in islice(reader, 3)]
+            if total_worlds is None:
+                total_worlds = len(top_worlds) + sum(1 for _ in reader)
+
+        if not top_worlds:
             return "No world data available."
-        
+
         # Create a concise summary without memory-intensive statistics
         summary = f"""Analytics Summary:
-        
-Total Worlds Processed: {len(worlds)}
+
+Total Worlds Processed: {total_worlds}
 Data File: {analytics_file}
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 Top 3 Worlds by Average Occupants:"""
-        
+
         # Only show top 3 to keep email concise
-        for i, world in enumerate(worlds[:3], 1):
+        for i, world in enumerate(top_worlds, 1):
             name = world.get('world_name', 'Unknown')
             avg_occupants = world.get('average_occupants', '0')
             summary += f"\n{i}. {name}: {avg_occupants} avg occupants"
-        
+
         return summary
-        
+
     except Exception as e:
         return f"Error reading analytics data: {str(e)}"
 
@@ -115,11 +146,11 @@ def create_email_message(config, analytics_summary):
     today = datetime.now().strftime('%Y-%m-%d')
     subject = f"PROD Daily Analytics - {today}"
     
-    msg = MIMEMultipart()
+    msg = EmailMessage()
     msg['From'] = config['FROM_EMAIL']
     msg['To'] = config['TO_EMAIL']
     msg['Subject'] = subject
-    
+
     # Email body with summary (not full statistics to save memory)
     body = f"""VRChat Analytics Report - {today}
 
@@ -129,43 +160,102 @@ Full analytics data is attached as CSV file.
 
 This email is sent automatically every {config['EMAIL_INTERVAL_HOURS']} hours.
 """
-    
-    msg.attach(MIMEText(body, 'plain'))
-    
-    # Attach the CSV file if it exists
+
+    msg.set_content(body)
+
+    # Attach the CSV file if it exists; add_attachment encodes in one C-level
+    # base64 pass instead of the old MIMEBase + encode_base64 round-trip
     if os.path.exists(config['ANALYTICS_FILE']):
         try:
             with open(config['ANALYTICS_FILE'], 'rb') as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
-            
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {os.path.basename(config["ANALYTICS_FILE"])}'
-            )
-            msg.attach(part)
+                msg.add_attachment(
+                    attachment.read(),
+                    maintype='text',
+                    subtype='csv',
+                    filename=os.path.basename(config['ANALYTICS_FILE'])
+                )
         except Exception as e:
             print(f"Warning: Could not attach analytics file: {e}")
-    
+
     return msg
 
 
-def send_email(config, message):
-    """Send the email using SMTP."""
-    try:
-        server = smtplib.SMTP(config['SMTP_SERVER'], config['SMTP_PORT'])
+class EmailSender:
+    """
+    SMTP sender that keeps one authenticated connection alive across sends.
+
+    The TLS handshake plus login costs several round-trips per message; when
+    the service runs in a long-lived loop, holding the connection open
+    removes that from every cycle. A NOOP probe detects idle connections the
+    server has dropped, and a send that dies mid-flight gets one
+    reconnect-and-retry.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.server = None
+
+    def _connect(self):
+        server = smtplib.SMTP(self.config['SMTP_SERVER'], self.config['SMTP_PORT'])
         server.starttls()
-        server.login(config['EMAIL_USERNAME'], config['EMAIL_PASSWORD'])
-        
-        text = message.as_string()
-        server.sendmail(config['FROM_EMAIL'], config['TO_EMAIL'], text)
-        server.quit()
-        
-        return True
-    except Exception as e:
-        print(f"Error sending email: {e}")
-        return False
+        server.login(self.config['EMAIL_USERNAME'], self.config['EMAIL_PASSWORD'])
+        self.server = server
+
+    def close(self):
+        """Quit the connection if one is open."""
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except Exception:
+                pass
+            self.server = None
+
+    def send(self, message):
+        """Send one message, reconnecting if the held connection is dead."""
+        try:
+            if self.server is None:
+                self._connect()
+            else:
+                try:
+                    self.server.noop()
+                except (smtplib.SMTPException, OSError):
+                    self.close()
+                    self._connect()
+
+            try:
+                # send_message serializes the message directly to the socket,
+                # avoiding the full as_string() copy in memory
+                self.server.send_message(message)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                # One retry for a connection that died mid-send
+                self.close()
+                self._connect()
+                self.server.send_message(message)
+
+            return True
+        except Exception as e:
+            print(f"Error sending email: {e}")
+            return False
+
+
+_sender = None
+
+
+def _close_sender():
+    if _sender is not None:
+        _sender.close()
+
+
+atexit.register(_close_sender)
+
+
+def send_email(config, message):
+    """Send the email using SMTP, reusing one connection across calls."""
+    global _sender
+    if _sender is None or _sender.config != config:
+        _close_sender()
+        _sender = EmailSender(config)
+    return _sender.send(message)
 
 
 def main():
@@ -16,8 +16,12 @@ Output: 'worlds_aggregated.csv' file
 import json
 import csv
 import os
-import glob
-from collections import defaultdict
+import sys
+import mmap
+import pickle
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
 # Try to import python-dotenv, fall back to defaults if not available
 try:
@@ -26,28 +30,194 @@ try:
 except ImportError:
     print("Warning: python-dotenv not found. Using default configuration.")
 
+# Try to import orjson for faster JSON parsing, fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Try to import ijson for streaming large files, fall back to full parsing.
+# Since ijson 3.x the import automatically selects the fastest available
+# backend (yajl2_c when the C extension is installed).
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Try to import pysimdjson for SIMD-accelerated parsing with lazy field
+# access, fall back to orjson/stdlib json
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# One parser per process, reused across files to amortize its internal
+# buffer allocations (each ProcessPoolExecutor worker gets its own copy)
+_simdjson_parser = simdjson.Parser() if simdjson is not None else None
 
+# Try to import numpy for vectorized post-processing, fall back to pure Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Try to import numba to JIT the business-metrics kernel, fall back to the
+# scalar implementation
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from environment variables with fallback defaults."""
+    """
+    Load configuration from environment variables with fallback defaults.
+
+    Cached: the environment does not change mid-run, so repeat callers get
+    the same dict without re-reading and re-casting the variables.
+    """
     config = {
         'DATA_LOCATION': os.getenv('DATA_LOCATION', 'data'),
         'MIN_OCCURRENCES': int(os.getenv('MIN_OCCURRENCES', '7')),
         'MIN_MARKETING_SPEND': float(os.getenv('MIN_MARKETING_SPEND', '15')),
-        'HEAT_POPULARITY_FACTOR': float(os.getenv('HEAT_POPULARITY_FACTOR', '1.0'))
+        'HEAT_POPULARITY_FACTOR': float(os.getenv('HEAT_POPULARITY_FACTOR', '1.0')),
+        'AGG_CACHE_FILE': os.getenv('AGG_CACHE_FILE', '.agg_cache.pkl')
     }
     return config
 
 
+def parse_json_file(file_path):
+    """
+    Parse a single JSON file, using orjson when available for faster parsing.
+
+    orjson parses from bytes and does not accept a file handle, so the file
+    is read in binary mode and decoded in one call. Falls back to stdlib
+    json when orjson is not installed.
+    """
+    if orjson is not None:
+        buf = map_file_bytes(file_path)
+        try:
+            # orjson rejects mmap objects, so mapped files go through a
+            # zero-copy memoryview; the view is a temporary and is released
+            # before the finally block closes the mapping
+            if isinstance(buf, mmap.mmap):
+                return orjson.loads(memoryview(buf))
+            return orjson.loads(buf)
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def prefetch_file(file_path):
+    """
+    Hint the kernel to start reading a file into the page cache.
+
+    posix_fadvise(WILLNEED) queues asynchronous readahead, so by the time
+    the parser faults the pages in, much of the file is already cached —
+    the reads overlap with parsing instead of stalling it. A no-op on
+    platforms without the call; errors are ignored since this is purely
+    advisory.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# Files at or below this size are read whole: setting up a mapping (mmap
+# syscall, page-table entries, later unmap) costs more than copying a small
+# file out of the page cache
+_MMAP_THRESHOLD = 1 << 20
+
+
+def map_file_bytes(file_path):
+    """
+    Return the contents of a file as a read-only buffer.
+
+    For large files, mmap lets the parsers consume pages straight from the
+    page cache without an intermediate copy into a bytes object (orjson and
+    pysimdjson both accept any buffer). Small files, empty files, and
+    filesystems that refuse to map fall back to a plain read. mmap buffers
+    must be closed by the caller once parsing is done.
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(buf, 'madvise'):
+                    # Sequential parse over the mapping: ask for aggressive
+                    # readahead instead of on-demand page faults
+                    try:
+                        buf.madvise(mmap.MADV_SEQUENTIAL)
+                        buf.madvise(mmap.MADV_WILLNEED)
+                    except (AttributeError, OSError):
+                        pass
+                return buf
+        except (ValueError, OSError):
+            pass
+        return f.read()
+
+
+# Array-form files at or below this size are parsed whole: orjson on a small
+# buffer beats ijson's event stream, and the memory win from streaming only
+# matters once a single file is a meaningful share of RSS
+_STREAM_THRESHOLD = 8 << 20
+
+
+def _should_stream(file_path):
+    """True when a file is an array-form dump big enough to stream."""
+    if ijson is None:
+        return False
+    try:
+        if os.path.getsize(file_path) <= _STREAM_THRESHOLD:
+            return False
+    except OSError:
+        return False
+    return peek_first_byte(file_path) == b'['
+
+
+def peek_first_byte(file_path):
+    """Return the first non-whitespace byte of a file (empty bytes if none)."""
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(1024)
+            if not chunk:
+                return b''
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1]
+
+
+def find_json_files(data_dir):
+    """Return the list of JSON file paths in the data directory."""
+    # os.scandir reads the directory in one pass instead of the per-entry
+    # stat work glob.glob does; entry.is_file() reuses the dirent data
+    try:
+        with os.scandir(data_dir) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
 def load_json_data(data_dir):
     """
     Load JSON data from all files and extract worlds and users.
-    
+
     Returns:
         tuple: (generator of world objects, dict of users by ID)
     """
-    json_pattern = os.path.join(data_dir, "*.json")
-    json_files = glob.glob(json_pattern)
-    
+    json_files = find_json_files(data_dir)
+
     if not json_files:
         print(f"Warning: No JSON files found in {data_dir}")
         return [], {}
@@ -60,16 +230,27 @@ def load_json_data(data_dir):
     def world_generator():
         for file_path in json_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
+                prefetch_file(file_path)
+                # Stream large top-level array files incrementally so peak
+                # memory stays at one world instead of the whole parsed file.
+                # The dict form ({"worlds": [...], "users": {...}}) still
+                # needs a full parse because the users lookup spans the whole
+                # file, and small files are faster parsed whole.
+                if _should_stream(file_path):
+                    with open(file_path, 'rb') as f:
+                        for world in ijson.items(f, 'item'):
+                            yield world
+                    continue
+
+                data = parse_json_file(file_path)
+
                 # Extract users if present and add to lookup
                 if isinstance(data, dict) and 'users' in data:
                     users_data = data['users']
                     if isinstance(users_data, list):
                         # Handle array format (old structure)
                         for user in users_data:
-                            user_id = safe_get(user, 'id')
+                            user_id = user.get('id') if isinstance(user, dict) else None
                             if user_id:
                                 users_lookup[user_id] = user
                     elif isinstance(users_data, dict):
@@ -109,269 +290,990 @@ def load_json_files(data_dir):
     return worlds_gen
 
 
-def safe_get(data, key, default=""):
-    """Safely get a value from a dictionary, returning default if key doesn't exist."""
-    return data.get(key, default) if isinstance(data, dict) else default
+# Alias key tables: each field can appear under several names depending on
+# the dump format; the first key with a truthy value wins. The keys are
+# interned so every lookup probes with the one canonical string object —
+# parsers that intern or cache their own key strings (CPython's json key
+# memo, orjson, pysimdjson) then hit the pointer-equality fast path in the
+# dict compare instead of a character comparison.
+def _intern_keys(*keys):
+    return tuple(sys.intern(key) for key in keys)
+
+
+_ID_KEYS = _intern_keys('id', 'worldId', 'world_id')
+_OCCUPANT_KEYS = _intern_keys('occupants', 'currentUsers', 'users')
+_IMAGE_KEYS = _intern_keys('imageUrl', 'image_url')
+_AUTHOR_ID_KEYS = _intern_keys('authorId', 'author_id')
+_AUTHOR_NAME_KEYS = _intern_keys('authorName', 'author_name')
+_BIO_LINK_KEYS = _intern_keys('bioLinks', 'bio_links')
+_BIO_KEYS = _intern_keys('bio', 'description')
+_DISPLAY_NAME_KEYS = _intern_keys('displayName', 'authorName', 'author_name')
+
+
+def get_alias(data, keys):
+    """Return the first truthy value among the given alias keys, else None."""
+    # Dumps can carry scalars where an object is expected (e.g. a users
+    # entry that is just a string); treat those as having no fields
+    if not isinstance(data, dict):
+        return None
+    get = data.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return None
 
 
 def format_bioLinks(bio_links):
     """Format social links into a string representation."""
     if not bio_links:
         return None
-    
-    if isinstance(bio_links, list):
-        if not bio_links:  # Empty list
-            return None
-        # Join multiple links with semicolon
-        valid_links = [str(link).strip() for link in bio_links if link and str(link).strip()]
-        return ";".join(valid_links) if valid_links else None
-    else:
-        link_str = str(bio_links).strip()
-        return link_str if link_str else None
+
+    # type() is an exact check, skipping isinstance's subclass walk; links
+    # are almost always str already, so avoid a redundant str() call
+    t = type(bio_links)
+    if t is list:
+        # Comprehension plus C-level filter instead of an append loop; the
+        # join of no survivors is '' which maps back to the None contract
+        stripped = (link.strip() if type(link) is str else str(link).strip()
+                    for link in bio_links if link)
+        return ";".join(filter(None, stripped)) or None
+
+    link_str = bio_links.strip() if t is str else str(bio_links).strip()
+    return link_str if link_str else None
 
 
 def format_bio(bio):
     """Format bio description with proper handling of missing values."""
     if not bio:
         return None
-    bio_str = str(bio).strip()
+    bio_str = bio.strip() if type(bio) is str else str(bio).strip()
     return bio_str if bio_str else None
 
 
+# Informational prints (file counts, cache reuse) are gated behind VERBOSE;
+# warnings and errors are always emitted, batched to stderr at end of run
+_VERBOSE = os.getenv('VERBOSE', '').lower() in ('1', 'true', 'yes')
+
+
+# Never-seen sentinel for min_occupants: int64 max, so a plain `<` compare
+# replaces the old negative-sentinel branch on every sighting and numpy's
+# minimum reduction works without lifting the sentinel first
+_MIN_SENTINEL = (1 << 63) - 1
+
+
+class WorldTable:
+    """
+    Struct-of-arrays accumulator for per-world statistics.
+
+    Instead of one 12-key dict per unique world, stats live in parallel
+    columns indexed by a compact row number, with id_to_idx mapping world_id
+    to its row. This roughly halves per-world memory (one small-int index
+    versus a dict header per world) and keeps the numeric columns ready for
+    vectorized post-processing.
+
+    Ingest uses plain Python lists: list.append is cheaper than per-record
+    scalar stores into NumPy arrays, and the numeric columns can be converted
+    wholesale once aggregation is done.
+    """
+
+    # The stat and metadata columns, one entry per row
+    COLUMNS = ('world_ids', 'occupants_sum', 'occurrences', 'max_occupants',
+               'min_occupants', 'names', 'image_urls', 'author_ids',
+               'author_names', 'bio_links', 'bios', 'heat', 'popularity',
+               'meta_done')
+
+    # A fixed attribute set: slots drop the per-instance __dict__ and make
+    # column attribute loads an index into the slot array
+    __slots__ = ('id_to_idx',) + COLUMNS
+
+    def __init__(self):
+        self.id_to_idx = {}
+        self.world_ids = []
+        self.occupants_sum = []
+        self.occurrences = []
+        self.max_occupants = []
+        self.min_occupants = []
+        self.names = []
+        self.image_urls = []
+        self.author_ids = []
+        self.author_names = []
+        self.bio_links = []
+        self.bios = []
+        self.heat = []
+        self.popularity = []
+        # True once every first-seen metadata field for the row is filled,
+        # letting later sightings skip the whole metadata block
+        self.meta_done = []
+
+    def __len__(self):
+        return len(self.world_ids)
+
+    def row_for(self, world_id):
+        """Return the row index for a world ID, appending a new row if needed."""
+        # setdefault resolves lookup and insert with one hash probe, where
+        # get-then-assign would probe twice for every new world
+        new_idx = len(self.world_ids)
+        idx = self.id_to_idx.setdefault(world_id, new_idx)
+        if idx == new_idx:
+            self.world_ids.append(world_id)
+            self.occupants_sum.append(0)
+            self.occurrences.append(0)
+            self.max_occupants.append(0)
+            # Int max = no sighting yet: any real count wins a plain min
+            # compare, so no sentinel branch is needed on the update path
+            self.min_occupants.append(_MIN_SENTINEL)
+            self.names.append('')
+            self.image_urls.append('')
+            self.author_ids.append('')
+            self.author_names.append('')
+            self.bio_links.append(None)
+            self.bios.append(None)
+            self.heat.append(0)
+            self.popularity.append(0)
+            self.meta_done.append(False)
+        return idx
+
+
+def extract_sighting(world):
+    """
+    Cheap projection of just the ID and occupant count of a world.
+
+    This is the only data a sighting contributes once a world's metadata is
+    already filled, so the fold path calls this alone for repeat sightings
+    and skips the string fields entirely.
+
+    Returns:
+        tuple: (world_id, occupants), or None if the world has no usable ID.
+    """
+    # Stray scalars in a worlds array have no fields at all; getattr rather
+    # than an isinstance check so the simdjson path can probe its lazy
+    # Object views through here too
+    get = getattr(world, 'get', None)
+    if get is None:
+        return None
+
+    # Alias lookups are spelled out as short-circuit get chains here instead
+    # of get_alias calls: this function runs once per record, and the chains
+    # drop the per-field call frames. Keep the keys in sync with the alias
+    # tables above.
+    world_id = get('id') or get('worldId') or get('world_id')
+    if not world_id:
+        return None
+    # World IDs repeat across every dump; interning collapses duplicates to
+    # one canonical string object. Within a worker this also shrinks the
+    # pickled result, since pickle memoizes by object identity.
+    if type(world_id) is str:
+        world_id = sys.intern(world_id)
+
+    # Occupants: first alias key whose value is present (0 counts)
+    occupants = get('occupants')
+    if occupants is None or occupants == "":
+        occupants = get('currentUsers')
+        if occupants is None or occupants == "":
+            occupants = get('users')
+            if occupants is None or occupants == "":
+                occupants = 0
+
+    # Coerce to int with a type dispatch: the JSON parsers already deliver
+    # ints for well-formed dumps, so the common case skips both the
+    # exception-handler setup and the int() string parser. Odd types fall
+    # through to the old coercion.
+    occ_type = type(occupants)
+    if occ_type is int:
+        pass
+    elif occ_type is float:
+        occupants = int(occupants)
+    elif occ_type is str and occupants.isdigit():
+        occupants = int(occupants)
+    else:
+        try:
+            occupants = int(occupants)
+        except (ValueError, TypeError):
+            occupants = 0
+
+    return world_id, occupants
+
+
+def extract_meta(world):
+    """
+    Project the metadata fields of a world dict.
+
+    Returns:
+        tuple: (name, image_url, author_id, author_name, bio_links, bio,
+                heat, popularity)
+    """
+    get = world.get
+
+    name = get('name', '')
+    image_url = get('imageUrl') or get('image_url')
+
+    # Author fields can live on the world or on a nested author object; the
+    # nested form is rare, so it keeps the get_alias helper
+    author = get('author')
+    if not isinstance(author, dict):
+        author = None
+
+    author_id = get('authorId') or get('author_id')
+    if not author_id and author:
+        author_id = get_alias(author, _AUTHOR_ID_KEYS)
+    if type(author_id) is str:
+        author_id = sys.intern(author_id)
+
+    author_name = get('authorName') or get('author_name')
+    if not author_name and author:
+        author_name = get_alias(author, _AUTHOR_NAME_KEYS)
+
+    bio_links = get('bioLinks') or get('bio_links')
+    if not bio_links and author:
+        bio_links = get_alias(author, _BIO_LINK_KEYS)
+
+    bio = get('bio') or get('description')
+    if not bio and author:
+        bio = get_alias(author, _BIO_KEYS)
+
+    heat = get('heat')
+    try:
+        heat = float(heat) if heat else 0
+    except (ValueError, TypeError):
+        heat = 0
+
+    popularity = get('popularity')
+    try:
+        popularity = float(popularity) if popularity else 0
+    except (ValueError, TypeError):
+        popularity = 0
+
+    return (name, image_url, author_id, author_name, bio_links, bio,
+            heat, popularity)
+
+
+def extract_world(world):
+    """
+    Project a world dict down to the compact record tuple used by aggregation.
+
+    Returns:
+        tuple: (world_id, occupants, name, image_url, author_id, author_name,
+                bio_links, bio, heat, popularity), or None if the world has
+                no usable ID.
+    """
+    sighting = extract_sighting(world)
+    if sighting is None:
+        return None
+    return sighting + extract_meta(world)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _agg_kernel(idxs, occs, sums, counts, maxes, mins):
+        """JIT-compiled scatter reduction of (slot, occupants) pairs."""
+        # Serial on purpose: slots repeat, so a prange version would race
+        for i in range(idxs.size):
+            idx = idxs[i]
+            o = occs[i]
+            sums[idx] += o
+            counts[idx] += 1
+            if o > maxes[idx]:
+                maxes[idx] = o
+            if o < mins[idx]:
+                mins[idx] = o
+else:
+    _agg_kernel = None
+
+
+def _fold_world(partials, idx_buf, occ_buf, world):
+    """
+    Fold one raw world dict into the per-file partial aggregates.
+
+    Each world's partial is a flat list
+    [occ_sum, occ_count, occ_max, occ_min, name, image_url, author_id,
+     author_name, bio_links, bio, heat, popularity, meta_complete] — string
+    fields fold first-seen, while numeric stats are buffered as flat (slot,
+    occupants) pairs and reduced in one pass by _reduce_partials. Until
+    then, slot 0 of a partial holds the world's row number.
+
+    bio_links and bio latch the *formatted* value (None until a value
+    survives format_bioLinks/format_bio), mirroring the parent merge's
+    "only update if we have actual data" checks — a raw-but-whitespace
+    first sighting must not lock out a later real one.
+
+    Once meta_complete flips True, repeat sightings read only the ID and
+    occupant count from the dict — the metadata fields are never extracted
+    again. Returns False when the world has no usable ID.
+    """
+    sighting = extract_sighting(world)
+    if sighting is None:
+        return False
+    world_id, occupants = sighting
+
+    p = partials.get(world_id)
+    if p is not None:
+        idx_buf.append(p[0])
+        occ_buf.append(occupants)
+        if p[12]:
+            return True
+        (name, image_url, author_id, author_name, bio_links, bio,
+         heat, popularity) = extract_meta(world)
+        if not p[4]:
+            p[4] = name
+        if not p[5]:
+            p[5] = image_url
+        if not p[6]:
+            p[6] = author_id
+        if not p[7]:
+            p[7] = author_name
+        if p[8] is None:
+            p[8] = format_bioLinks(bio_links)
+        if p[9] is None:
+            p[9] = format_bio(bio)
+        if not p[10]:
+            p[10] = heat
+        if not p[11]:
+            p[11] = popularity
+        p[12] = bool(p[4] and p[5] and p[6] and p[7]
+                     and p[8] is not None and p[9] is not None
+                     and p[10] and p[11])
+        return True
+
+    # p[0] temporarily carries the slot; _reduce_partials overwrites p[0:4]
+    # with the reduced stats and strips the meta_complete flag
+    (name, image_url, author_id, author_name, bio_links, bio,
+     heat, popularity) = extract_meta(world)
+    bio_links = format_bioLinks(bio_links)
+    bio = format_bio(bio)
+    slot = len(partials)
+    partials[world_id] = [slot, 0, 0, 0, name, image_url, author_id,
+                          author_name, bio_links, bio, heat, popularity,
+                          bool(name and image_url and author_id
+                               and author_name and bio_links is not None
+                               and bio is not None and heat and popularity)]
+    idx_buf.append(slot)
+    occ_buf.append(occupants)
+    return True
+
+
+def _reduce_partials(partials, idx_buf, occ_buf):
+    """
+    Reduce the buffered (slot, occupants) pairs into the partials.
+
+    One tight pass over two flat arrays replaces per-record list updates in
+    the fold loop: the numba kernel when available, numpy's unbuffered
+    ufunc.at reductions otherwise, or a plain Python loop without either.
+    Returns partials for convenience at the worker's return sites.
+    """
+    n = len(partials)
+    if n == 0:
+        return partials
+
+    if np is not None:
+        idxs = np.fromiter(idx_buf, np.int64, len(idx_buf))
+        occs = np.fromiter(occ_buf, np.int64, len(occ_buf))
+        sums = np.zeros(n, np.int64)
+        counts = np.zeros(n, np.int64)
+        # Every slot has at least one record (it was created by one), so
+        # these extreme initial values never survive the reduction
+        int64_info = np.iinfo(np.int64)
+        maxes = np.full(n, int64_info.min, np.int64)
+        mins = np.full(n, int64_info.max, np.int64)
+
+        if _agg_kernel is not None:
+            _agg_kernel(idxs, occs, sums, counts, maxes, mins)
+        else:
+            np.add.at(sums, idxs, occs)
+            np.add.at(counts, idxs, 1)
+            np.maximum.at(maxes, idxs, occs)
+            np.minimum.at(mins, idxs, occs)
+
+        sums = sums.tolist()
+        counts = counts.tolist()
+        maxes = maxes.tolist()
+        mins = mins.tolist()
+        for slot, p in enumerate(partials.values()):
+            p[0] = sums[slot]
+            p[1] = counts[slot]
+            p[2] = maxes[slot]
+            p[3] = mins[slot]
+            del p[12:]
+    else:
+        sums = [0] * n
+        counts = [0] * n
+        maxes = [None] * n
+        mins = [None] * n
+        for idx, occupants in zip(idx_buf, occ_buf):
+            sums[idx] += occupants
+            counts[idx] += 1
+            if maxes[idx] is None or occupants > maxes[idx]:
+                maxes[idx] = occupants
+            if mins[idx] is None or occupants < mins[idx]:
+                mins[idx] = occupants
+        for slot, p in enumerate(partials.values()):
+            p[0] = sums[slot]
+            p[1] = counts[slot]
+            p[2] = maxes[slot]
+            p[3] = mins[slot]
+            del p[12:]
+
+    return partials
+
+
+def _parse_file(file_path):
+    """
+    Worker function: parse one JSON file, project its worlds, and reduce
+    them to per-world partial aggregates.
+
+    Runs in a ProcessPoolExecutor worker so the large parsed dicts stay in
+    the worker process; only one compact partial per unique world, the
+    (small) users lookup and any diagnostics cross the pickle boundary back
+    to the parent. Diagnostics are returned rather than printed so a
+    worker's parse loop never blocks on write syscalls; the parent flushes
+    them to stderr in one batch at end of run.
+
+    Returns:
+        tuple: (dict of world_id -> partial from _fold_world,
+                dict of users by ID, list of diagnostic messages)
+    """
+    # Kick off kernel readahead before touching the bytes, so the read
+    # overlaps with parsing instead of stalling it
+    prefetch_file(file_path)
+
+    if simdjson is not None:
+        return _parse_file_simdjson(file_path)
+
+    partials = {}
+    idx_buf = []
+    occ_buf = []
+    users = {}
+    errors = []
+    try:
+        # Stream large top-level array files so the worker never holds the
+        # whole parsed file either; dict-form and small files parse whole.
+        if _should_stream(file_path):
+            with open(file_path, 'rb') as f:
+                for world in ijson.items(f, 'item'):
+                    if not _fold_world(partials, idx_buf, occ_buf, world):
+                        errors.append("Warning: Found world without ID, skipping")
+            return _reduce_partials(partials, idx_buf, occ_buf), users, errors
+
+        data = parse_json_file(file_path)
+
+        # Extract users if present and add to lookup
+        if isinstance(data, dict) and 'users' in data:
+            users_data = data['users']
+            if isinstance(users_data, list):
+                # Handle array format (old structure)
+                for user in users_data:
+                    user_id = user.get('id') if isinstance(user, dict) else None
+                    if user_id:
+                        users[user_id] = user
+            elif isinstance(users_data, dict):
+                # Handle object format (new structure) where keys are user IDs
+                for user_id, user in users_data.items():
+                    if user_id:
+                        users[user_id] = user
+
+        # Handle different possible JSON structures for worlds
+        if isinstance(data, list):
+            worlds = data
+        elif isinstance(data, dict):
+            if 'worlds' in data:
+                worlds = data['worlds']
+            elif 'users' not in data:
+                # Single world object (and no users key)
+                worlds = [data]
+            else:
+                worlds = []
+        else:
+            errors.append(f"Warning: Unexpected data structure in {file_path}")
+            worlds = []
+
+        for world in worlds:
+            if not _fold_world(partials, idx_buf, occ_buf, world):
+                errors.append("Warning: Found world without ID, skipping")
+
+    except json.JSONDecodeError as e:
+        errors.append(f"Error parsing JSON file {file_path}: {e}")
+    except Exception as e:
+        errors.append(f"Error processing file {file_path}: {e}")
+
+    return _reduce_partials(partials, idx_buf, occ_buf), users, errors
+
+
+def _parse_file_simdjson(file_path):
+    """
+    simdjson variant of _parse_file.
+
+    parser.parse returns lazy Object/Array views over the parsed tape, so the
+    outer structure is never materialized as Python dicts; each world is
+    converted with as_dict() only as it is projected, and users only when a
+    file actually carries them. The lazy views must all be dropped before the
+    shared parser can be reused for the next file, which holds here because
+    they are locals of this function.
+    """
+    partials = {}
+    idx_buf = []
+    occ_buf = []
+    users = {}
+    errors = []
+    try:
+        buf = map_file_bytes(file_path)
+        try:
+            # pysimdjson copies the input into its own padded buffer during
+            # parse, so the mapping can be dropped right away
+            doc = _simdjson_parser.parse(buf)
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+        if hasattr(doc, 'get'):
+            # Object form: {"worlds": [...]} and/or {"users": ...},
+            # or a single bare world object
+            top_keys = set(doc.keys())
+
+            if 'users' in top_keys:
+                users_data = doc['users']
+                if hasattr(users_data, 'get'):
+                    # Object format (new structure) where keys are user IDs.
+                    # Values are usually objects, but scalars come back as
+                    # Python primitives with no as_dict — store those as-is,
+                    # matching the json branch
+                    for user_id in users_data.keys():
+                        if user_id:
+                            user = users_data[user_id]
+                            if hasattr(user, 'as_dict'):
+                                user = user.as_dict()
+                            users[user_id] = user
+                else:
+                    # Array format (old structure); non-object entries have
+                    # no ID and are skipped, as in the json branch
+                    for user in users_data:
+                        if hasattr(user, 'as_dict'):
+                            user = user.as_dict()
+                        user_id = user.get('id') if isinstance(user, dict) else None
+                        if user_id:
+                            users[user_id] = user
+
+            if 'worlds' in top_keys:
+                worlds = doc['worlds']
+            elif 'users' not in top_keys:
+                worlds = [doc]
+            else:
+                worlds = []
+        else:
+            # Top-level array of worlds
+            worlds = doc
+
+        for world in worlds:
+            if not isinstance(world, dict):
+                # Probe the lazy view first: for a world whose metadata is
+                # already complete, only the ID and occupant count are read
+                # and the rest of the subtree is never materialized
+                # Scalar array elements come back as Python primitives and
+                # fail the probe (no fields, so no usable ID), which keeps
+                # as_dict() below reachable only for lazy Object views
+                sighting = extract_sighting(world)
+                if sighting is None:
+                    errors.append("Warning: Found world without ID, skipping")
+                    continue
+                p = partials.get(sighting[0])
+                if p is not None and p[12]:
+                    idx_buf.append(p[0])
+                    occ_buf.append(sighting[1])
+                    continue
+                world = world.as_dict()
+            if not _fold_world(partials, idx_buf, occ_buf, world):
+                errors.append("Warning: Found world without ID, skipping")
+
+    except ValueError as e:
+        errors.append(f"Error parsing JSON file {file_path}: {e}")
+    except Exception as e:
+        errors.append(f"Error processing file {file_path}: {e}")
+
+    return _reduce_partials(partials, idx_buf, occ_buf), users, errors
+
+
+# Constant-folded business formula factors:
+#   orders = (daily_visitors × 30) / 10000
+#   max_marketing_spend = orders × $400 revenue × 35% margin
+_ORDER_FACTOR = 30 / 10000
+_SPEND_FACTOR = 400 * 0.35
+
+
 def calculate_business_metrics(avg_occupants, heat_popularity_factor):
     """
     Calculate business analytics metrics using simplified factor system.
-    
+
     Args:
         avg_occupants: Average number of occupants
         heat_popularity_factor: Configurable multiplier factor
-    
+
     Returns:
-        tuple: (estimated_orders, max_marketing_spend)
+        tuple: (estimated_orders, max_marketing_spend) as raw floats; rounding
+        happens once at CSV formatting time
     """
     # Simplified calculation: daily_visitors = avg_occupants × HEAT_POPULARITY_FACTOR
     daily_visitors = avg_occupants * heat_popularity_factor
-    
-    # Order estimation formula: (daily_visitors × 30) / 10000
-    estimated_orders = (daily_visitors * 30) / 10000
-    
-    # Maximum marketing spend formula: orders × 400 × 0.35
-    max_marketing_spend = estimated_orders * 400 * 0.35
-    
-    # Round to 2 decimal places
-    estimated_orders = round(estimated_orders, 2)
-    max_marketing_spend = round(max_marketing_spend, 2)
-    
+
+    estimated_orders = daily_visitors * _ORDER_FACTOR
+    max_marketing_spend = estimated_orders * _SPEND_FACTOR
+
     return estimated_orders, max_marketing_spend
 
 
-def aggregate_world_data(data_dir):
+if njit is not None:
+    # No fastmath: its reassociation license could shift values right at
+    # the MIN_MARKETING_SPEND filter boundary, and the kernel is three
+    # multiplies with nothing for fastmath to fuse anyway. Keeping IEEE
+    # semantics is what makes the results bit-identical with the scalar
+    # calculate_business_metrics.
+    @njit(parallel=True, cache=True)
+    def _business_metrics_kernel(avg, factor, orders, spend):
+        """JIT-compiled batch version of calculate_business_metrics."""
+        for i in prange(avg.size):
+            daily_visitors = avg[i] * factor
+            orders[i] = daily_visitors * _ORDER_FACTOR
+            spend[i] = orders[i] * _SPEND_FACTOR
+else:
+    _business_metrics_kernel = None
+
+
+def _load_agg_cache(cache_file):
+    """
+    Load the per-file aggregate cache.
+
+    Returns the cached {path: (signature, partials, users)} mapping, or an
+    empty dict if the cache file is missing, from a different format
+    version, or unreadable for any reason — a corrupt cache is never worth
+    failing a run over, the affected files just get re-parsed.
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            state = pickle.load(f)
+        if state.get('version') != 3:
+            return {}
+        return state['files']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError,
+            AttributeError, TypeError):
+        return {}
+
+
+def _save_agg_cache(cache_file, files):
+    """
+    Persist the per-file aggregate cache for the next run.
+
+    Writes to a temp file and renames so a crash mid-save cannot leave a
+    truncated cache behind.
+    """
+    # Version 3: partials carry formatted bio fields
+    state = {'version': 3, 'files': files}
+    tmp_path = cache_file + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not save aggregation cache: {e}")
+
+
+def aggregate_world_data(data_dir, cache_file=None):
     """
     Memory-optimized aggregation of world data from JSON files with dynamic user lookup.
-    
+
+    When cache_file is set, each file's partial aggregates are cached keyed
+    by (mtime_ns, size), so a rerun over a mostly-unchanged data directory
+    only parses new or modified files and merges the rest straight from the
+    cache. Entries for files that disappeared from the directory are
+    dropped on save, which keeps the cache bounded by the directory
+    contents. Merging always happens in directory order, so cached and
+    freshly parsed files produce the same table as a cold run.
+
     Returns:
-        dict: Dictionary with world_id as key and aggregated data as value
-    """
-    world_data = defaultdict(lambda: {
-        'occupants_sum': 0,
-        'occurrences': 0,
-        'max_occupants': 0,
-        'min_occupants': float('inf'),
-        'name': '',
-        'image_url': '',
-        'author_id': '',
-        'author_name': '',
-        'bioLinks': None,
-        'bio': None,
-        'heat': 0,
-        'popularity': 0
-    })
-    
+        WorldTable: struct-of-arrays accumulator with one row per unique world
+    """
+    table = WorldTable()
+
     world_count = 0
-    
-    # Load both worlds and users data
-    worlds_generator, users_lookup = load_json_data(data_dir)
-    
-    for world in worlds_generator:
-        world_id = safe_get(world, 'id')
-        if not world_id:
-            # Try alternative field names
-            world_id = safe_get(world, 'worldId') or safe_get(world, 'world_id')
-        
-        if not world_id:
-            print("Warning: Found world without ID, skipping")
-            continue
-        
-        world_count += 1
-        
-        # Get occupants (try different possible field names)
-        occupants = safe_get(world, 'occupants')
-        if occupants is None or occupants == "":
-            occupants = safe_get(world, 'currentUsers')
-            if occupants is None or occupants == "":
-                occupants = safe_get(world, 'users')
-                if occupants is None or occupants == "":
-                    occupants = 0
-        
+    users_lookup = {}
+
+    json_files = find_json_files(data_dir)
+
+    if not json_files:
+        print(f"Warning: No JSON files found in {data_dir}")
+        return table
+
+    if _VERBOSE:
+        print(f"Found {len(json_files)} JSON files to process")
+
+    cache = _load_agg_cache(cache_file) if cache_file else {}
+    cached = {}
+    parse_sigs = {}
+    to_parse = []
+    for file_path in json_files:
         try:
-            occupants = int(occupants)
-        except (ValueError, TypeError):
-            occupants = 0
-        
-        # Aggregate data
-        world_info = world_data[world_id]
-        world_info['occupants_sum'] += occupants
-        world_info['occurrences'] += 1
-        
-        # Track min/max occupants
-        world_info['max_occupants'] = max(world_info['max_occupants'], occupants)
-        if world_info['min_occupants'] == float('inf'):
-            world_info['min_occupants'] = occupants
+            st = os.stat(file_path)
+            sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig = None
+        entry = cache.get(file_path)
+        if sig is not None and entry is not None and entry[0] == sig:
+            cached[file_path] = entry
         else:
-            world_info['min_occupants'] = min(world_info['min_occupants'], occupants)
-        
-        # Store world details (use first occurrence values)
-        if not world_info['name']:
-            world_info['name'] = safe_get(world, 'name')
-        
-        if not world_info['image_url']:
-            world_info['image_url'] = safe_get(world, 'imageUrl') or safe_get(world, 'image_url')
-        
-        if not world_info['author_id']:
-            # Try to get author_id from different locations
-            author_id = safe_get(world, 'authorId') or safe_get(world, 'author_id')
-            
-            # If not found, try author nested object
-            if not author_id:
-                author = safe_get(world, 'author')
-                if author:
-                    author_id = safe_get(author, 'authorId') or safe_get(author, 'author_id')
-            
-            if author_id:
-                world_info['author_id'] = author_id
-        
-        if not world_info['author_name']:
-            # Try to get author_name from different locations
-            author_name = safe_get(world, 'authorName') or safe_get(world, 'author_name')
-            
-            # If not found, try author nested object
-            if not author_name:
-                author = safe_get(world, 'author')
-                if author:
-                    author_name = safe_get(author, 'authorName') or safe_get(author, 'author_name')
-            
-            # If still not found, try separate user lookup by authorId
-            if not author_name and world_info['author_id'] and world_info['author_id'] in users_lookup:
-                user_data = users_lookup[world_info['author_id']]
-                author_name = safe_get(user_data, 'displayName') or safe_get(user_data, 'authorName') or safe_get(user_data, 'author_name')
-            
-            if author_name:
-                world_info['author_name'] = author_name
-        
-        # Enhanced logic for bioLinks - check if we haven't found valid data yet
-        if world_info['bioLinks'] is None:
-            # Try to get bioLinks from different locations
-            bio_links = None
-            
-            # First try direct world fields
-            bio_links = safe_get(world, 'bioLinks') or safe_get(world, 'bio_links')
-            
-            # If not found, try author nested object
-            if not bio_links:
-                author = safe_get(world, 'author')
-                if author:
-                    bio_links = safe_get(author, 'bioLinks') or safe_get(author, 'bio_links')
-            
-            # If still not found, try separate user lookup by authorId
-            if not bio_links and world_info['author_id'] and world_info['author_id'] in users_lookup:
-                user_data = users_lookup[world_info['author_id']]
-                bio_links = safe_get(user_data, 'bioLinks') or safe_get(user_data, 'bio_links')
-            
-            formatted_links = format_bioLinks(bio_links)
-            if formatted_links is not None:  # Only update if we have actual data
-                world_info['bioLinks'] = formatted_links
-        
-        # Enhanced logic for bio - check if we haven't found valid data yet  
-        if world_info['bio'] is None:
-            # Try to get bio from different locations
-            bio = None
-            
-            # First try direct world fields
-            bio = safe_get(world, 'bio') or safe_get(world, 'description')
-            
-            # If not found, try author nested object
-            if not bio:
-                author = safe_get(world, 'author')
-                if author:
-                    bio = safe_get(author, 'bio') or safe_get(author, 'description')
-            
-            # If still not found, try separate user lookup by authorId
-            if not bio and world_info['author_id'] and world_info['author_id'] in users_lookup:
-                user_data = users_lookup[world_info['author_id']]
-                bio = safe_get(user_data, 'bio') or safe_get(user_data, 'description')
-            
-            formatted_bio = format_bio(bio)
-            if formatted_bio is not None:  # Only update if we have actual data
-                world_info['bio'] = formatted_bio
-        
-        # Extract heat and popularity (use first occurrence values)
-        if world_info['heat'] == 0:
-            heat = safe_get(world, 'heat')
-            try:
-                world_info['heat'] = float(heat) if heat else 0
-            except (ValueError, TypeError):
-                world_info['heat'] = 0
-        
-        if world_info['popularity'] == 0:
-            popularity = safe_get(world, 'popularity')
-            try:
-                world_info['popularity'] = float(popularity) if popularity else 0
-            except (ValueError, TypeError):
-                world_info['popularity'] = 0
-    
+            parse_sigs[file_path] = sig
+            to_parse.append(file_path)
+
+    if cached and _VERBOSE:
+        print(f"Reusing cached aggregates for {len(cached)} of "
+              f"{len(json_files)} files")
+
+    new_cache = {}
+    error_log = []
+
+    # Parse files in parallel: each worker parses one file and reduces it to
+    # per-world partial aggregates, so the per-record work happens on all
+    # cores and the parent merges one partial per world per file. The merge
+    # walks json_files in order, taking each file's partials either from the
+    # cache or from the pool iterator — to_parse preserves the relative
+    # order, so the next pool result always belongs to the next uncached
+    # file and merging stays streaming.
+    with ProcessPoolExecutor() as executor:
+        pool_iter = executor.map(_parse_file, to_parse, chunksize=4)
+        for file_path in json_files:
+            entry = cached.get(file_path)
+            if entry is not None:
+                # Cached files reported their diagnostics when first parsed
+                sig, partials, users = entry
+            else:
+                partials, users, errors = next(pool_iter)
+                error_log.extend(errors)
+                sig = parse_sigs[file_path]
+            if sig is not None:
+                new_cache[file_path] = (sig, partials, users)
+
+            users_lookup.update(users)
+
+            for world_id, partial in partials.items():
+                (occ_sum, occ_count, occ_max, occ_min, name, image_url,
+                 author_id, author_name, bio_links, bio, heat,
+                 popularity) = partial
+
+                world_count += occ_count
+
+                # Merge numeric stats. Re-intern the ID here: unpickling in
+                # the parent made a fresh string, and interning makes the
+                # dict lookup a pointer compare for every later sighting.
+                idx = table.row_for(sys.intern(world_id))
+                table.occupants_sum[idx] += occ_sum
+                table.occurrences[idx] += occ_count
+                if occ_max > table.max_occupants[idx]:
+                    table.max_occupants[idx] = occ_max
+                if occ_min < table.min_occupants[idx]:
+                    table.min_occupants[idx] = occ_min
+
+                # Store world details (use first occurrence values); once
+                # every metadata field is filled, the whole block is skipped
+                # for later sightings of the same world
+                if not table.meta_done[idx]:
+                    if not table.names[idx]:
+                        table.names[idx] = name
+
+                    if not table.image_urls[idx]:
+                        table.image_urls[idx] = image_url
+
+                    if not table.author_ids[idx] and author_id:
+                        table.author_ids[idx] = author_id
+
+                    if not table.author_names[idx]:
+                        # If the record has no author name, try the separate user
+                        # lookup by authorId
+                        if not author_name and table.author_ids[idx] in users_lookup:
+                            user_data = users_lookup[table.author_ids[idx]]
+                            author_name = get_alias(user_data, _DISPLAY_NAME_KEYS)
+
+                        if author_name:
+                            table.author_names[idx] = author_name
+
+                    # Enhanced logic for bioLinks - check if we haven't found valid data yet
+                    if table.bio_links[idx] is None:
+                        # If the record has none, try the separate user lookup by authorId
+                        if not bio_links and table.author_ids[idx] in users_lookup:
+                            user_data = users_lookup[table.author_ids[idx]]
+                            bio_links = get_alias(user_data, _BIO_LINK_KEYS)
+
+                        formatted_links = format_bioLinks(bio_links)
+                        if formatted_links is not None:  # Only update if we have actual data
+                            table.bio_links[idx] = formatted_links
+
+                    # Enhanced logic for bio - check if we haven't found valid data yet
+                    if table.bios[idx] is None:
+                        # If the record has none, try the separate user lookup by authorId
+                        if not bio and table.author_ids[idx] in users_lookup:
+                            user_data = users_lookup[table.author_ids[idx]]
+                            bio = get_alias(user_data, _BIO_KEYS)
+
+                        formatted_bio = format_bio(bio)
+                        if formatted_bio is not None:  # Only update if we have actual data
+                            table.bios[idx] = formatted_bio
+
+                    # Heat and popularity (use first occurrence values)
+                    if table.heat[idx] == 0:
+                        table.heat[idx] = heat
+
+                    if table.popularity[idx] == 0:
+                        table.popularity[idx] = popularity
+
+                    table.meta_done[idx] = bool(
+                        table.names[idx] and table.image_urls[idx]
+                        and table.author_ids[idx] and table.author_names[idx]
+                        and table.bio_links[idx] is not None
+                        and table.bios[idx] is not None
+                        and table.heat[idx] and table.popularity[idx]
+                    )
+
+    # One write for all diagnostics instead of a syscall per message
+    if error_log:
+        error_log.append('')
+        sys.stderr.write('\n'.join(error_log))
+
     print(f"Processed {world_count} world entries")
-    print(f"Found {len(world_data)} unique worlds")
-    
-    return world_data
+    print(f"Found {len(table)} unique worlds")
 
+    if cache_file:
+        _save_agg_cache(cache_file, new_cache)
 
-def calculate_averages_and_sort(world_data, config):
+    return table
+
+
+def calculate_averages_and_sort(table, config):
     """
     Calculate average occupants for each world and return sorted list.
     Filters worlds based on occurrences and marketing spend thresholds.
-    
+
     Args:
-        world_data: Dictionary of world data
+        table: WorldTable accumulator from aggregate_world_data
         config: Configuration dictionary with MIN_OCCURRENCES, MIN_MARKETING_SPEND, etc.
-    
+
     Returns:
         list: List of tuples (world_id, world_info) sorted by average occupants (descending)
     """
+    if np is not None:
+        return _averages_and_sort_numpy(table, config)
+
+    # Hoist config values out of the loop: a local load beats a dict
+    # lookup per world
+    min_occurrences = config['MIN_OCCURRENCES']
+    min_spend = config['MIN_MARKETING_SPEND']
+    factor = config['HEAT_POPULARITY_FACTOR']
+
     world_list = []
-    
-    for world_id, info in world_data.items():
-        if info['occurrences'] >= config['MIN_OCCURRENCES']:
-            average_occupants = info['occupants_sum'] / info['occurrences']
-            info['average_occupants'] = round(average_occupants, 2)
-            
-            # Handle case where min_occupants was never updated (no data)
-            if info['min_occupants'] == float('inf'):
-                info['min_occupants'] = 0
-            
+
+    for idx in range(len(table)):
+        occurrences = table.occurrences[idx]
+        if occurrences >= min_occurrences:
+            average_occupants = table.occupants_sum[idx] / occurrences
+
+            # Every row was created by a sighting, so the never-seen
+            # sentinel cannot appear on rows that pass the occurrence filter
+            min_occupants = table.min_occupants[idx]
+
             # Calculate business metrics using simplified system
             estimated_orders, max_marketing_spend = calculate_business_metrics(
-                average_occupants, config['HEAT_POPULARITY_FACTOR']
+                average_occupants, factor
             )
-            info['estimated_orders'] = estimated_orders
-            info['max_marketing_spend'] = max_marketing_spend
-            
+
             # Filter by marketing spend threshold
-            if max_marketing_spend >= config['MIN_MARKETING_SPEND']:
-                world_list.append((world_id, info))
-    
+            if max_marketing_spend >= min_spend:
+                # Materialize an info dict only for surviving rows
+                info = {
+                    'name': table.names[idx],
+                    'average_occupants': round(average_occupants, 2),
+                    'occurrences': occurrences,
+                    'max_occupants': table.max_occupants[idx],
+                    'min_occupants': min_occupants,
+                    'heat': table.heat[idx],
+                    'popularity': table.popularity[idx],
+                    'estimated_orders': estimated_orders,
+                    'max_marketing_spend': max_marketing_spend,
+                    'image_url': table.image_urls[idx],
+                    'author_id': table.author_ids[idx],
+                    'author_name': table.author_names[idx],
+                    'bio': table.bios[idx],
+                    'bioLinks': table.bio_links[idx]
+                }
+                world_list.append((table.world_ids[idx], info))
+
     # Sort by average occupants (highest first)
     world_list.sort(key=lambda x: x[1]['average_occupants'], reverse=True)
-    
+
+    return world_list
+
+
+def _averages_and_sort_numpy(table, config):
+    """
+    NumPy implementation of calculate_averages_and_sort.
+
+    The average, the occurrence filter and the sort run as vectorized array
+    operations (one C-level division and argsort instead of a Python loop
+    with a comparator); per-row Python work is limited to surviving rows.
+    """
+    min_spend = config['MIN_MARKETING_SPEND']
+    factor = config['HEAT_POPULARITY_FACTOR']
+
+    occ_cnt = np.asarray(table.occurrences, dtype=np.int64)
+    occ_sum = np.asarray(table.occupants_sum, dtype=np.int64)
+
+    avg = np.divide(occ_sum, occ_cnt, out=np.zeros(occ_cnt.shape), where=occ_cnt > 0)
+
+    candidates = np.flatnonzero(occ_cnt >= config['MIN_OCCURRENCES'])
+    # Match the pure-Python path: sort on the rounded average, descending,
+    # keeping insertion order for ties (list.sort is stable)
+    order = candidates[np.argsort(-np.round(avg[candidates], 2), kind='stable')]
+
+    # Business metrics for all candidate rows in one batch: the JIT kernel
+    # runs the loop compiled and in parallel when numba is installed;
+    # otherwise two vectorized multiplies produce the same arrays. The
+    # operation order matches the scalar formula so the floats are
+    # bit-identical with calculate_business_metrics.
+    if _business_metrics_kernel is not None and order.size:
+        orders_arr = np.empty(order.size)
+        spend_arr = np.empty(order.size)
+        _business_metrics_kernel(avg[order], factor, orders_arr, spend_arr)
+    else:
+        orders_arr = avg[order] * factor * _ORDER_FACTOR
+        spend_arr = orders_arr * _SPEND_FACTOR
+
+    world_list = []
+
+    for pos, idx in enumerate(order):
+        idx = int(idx)
+        average_occupants = table.occupants_sum[idx] / table.occurrences[idx]
+
+        # Every row was created by a sighting, so the never-seen sentinel
+        # cannot appear on rows that pass the occurrence filter
+        min_occupants = table.min_occupants[idx]
+
+        # Business metrics come from the batch arrays above
+        estimated_orders = float(orders_arr[pos])
+        max_marketing_spend = float(spend_arr[pos])
+
+        # Filter by marketing spend threshold (doesn't disturb the sort order)
+        if max_marketing_spend >= min_spend:
+            info = {
+                'name': table.names[idx],
+                'average_occupants': round(average_occupants, 2),
+                'occurrences': table.occurrences[idx],
+                'max_occupants': table.max_occupants[idx],
+                'min_occupants': min_occupants,
+                'heat': table.heat[idx],
+                'popularity': table.popularity[idx],
+                'estimated_orders': estimated_orders,
+                'max_marketing_spend': max_marketing_spend,
+                'image_url': table.image_urls[idx],
+                'author_id': table.author_ids[idx],
+                'author_name': table.author_names[idx],
+                'bio': table.bios[idx],
+                'bioLinks': table.bio_links[idx]
+            }
+            world_list.append((table.world_ids[idx], info))
+
     return world_list
 
 
@@ -395,30 +1297,40 @@ def write_csv_output(world_list, output_file, config):
         'bioLinks'
     ]
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+    # A 1 MiB buffer keeps syscall count low for large outputs, and
+    # writerows lets the C csv implementation drive the row loop
+    with open(output_file, 'w', newline='', encoding='utf-8',
+              buffering=1 << 20) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(headers)
-        
-        for world_id, info in world_list:
-            row = [
-                info['name'] if info['name'] else world_id,
-                world_id,
-                info['average_occupants'],
-                info['occurrences'],
-                info['max_occupants'],
-                info['min_occupants'],
-                info['heat'],
-                info['popularity'],
-                info['estimated_orders'],
-                info['max_marketing_spend'],
-                info['image_url'] if info['image_url'] else "NA",
-                info['author_id'] if info['author_id'] else "NA",
-                info['author_name'] if info['author_name'] else "NA",
-                info['bio'] if info['bio'] is not None else "NA",
-                info['bioLinks'] if info['bioLinks'] is not None else "NA"
-            ]
-            writer.writerow(row)
-    
+        writer.writerows(
+            (info['name'] if info['name'] else world_id,
+             world_id,
+             info['average_occupants'],
+             info['occurrences'],
+             info['max_occupants'],
+             info['min_occupants'],
+             info['heat'],
+             info['popularity'],
+             f"{info['estimated_orders']:.2f}",
+             f"{info['max_marketing_spend']:.2f}",
+             info['image_url'] if info['image_url'] else "NA",
+             info['author_id'] if info['author_id'] else "NA",
+             info['author_name'] if info['author_name'] else "NA",
+             info['bio'] if info['bio'] is not None else "NA",
+             info['bioLinks'] if info['bioLinks'] is not None else "NA")
+            for world_id, info in world_list
+        )
+
+    # Sidecar metadata so consumers (e.g. the email service) can get the
+    # row count without re-reading the whole CSV
+    meta = {
+        'total_worlds': len(world_list),
+        'generated': datetime.now().isoformat()
+    }
+    with open(output_file + '.meta', 'w', encoding='utf-8') as meta_file:
+        json.dump(meta, meta_file)
+
     # Simplified output - removed memory-intensive summary statistics
     print(f"Results written to {output_file} ({len(world_list)} worlds)")
 
@@ -448,14 +1360,14 @@ def main():
     
     # Aggregate world data
     print(f"Processing JSON files in '{data_dir}' directory...")
-    world_data = aggregate_world_data(data_dir)
+    world_table = aggregate_world_data(data_dir, config['AGG_CACHE_FILE'])
     
-    if not world_data:
+    if not world_table:
         print("No world data found to process")
         return 1
     
     # Calculate averages and sort with configuration
-    world_list = calculate_averages_and_sort(world_data, config)
+    world_list = calculate_averages_and_sort(world_table, config)
     
     # Write output CSV
     write_csv_output(world_list, output_file, config)
@@ -39,33 +39,34 @@ def main():
     print("===================================")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    # Check the email interval before doing any work: on an idle cron tick
+    # this skips the whole O(files) analytics parse, not just the send
+    if args.force_email:
+        print("Force email flag set - sending email regardless of interval.")
+    else:
+        email_config = load_email_config()
+
+        if not should_send_email(email_config):
+            print("24-hour interval not reached - skipping analytics and email.")
+            print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            return 0
+
+        print("24-hour interval reached - running analytics and sending email.")
+
     # Step 1: Run analytics processing (memory-optimized)
     print("\n[1/2] Running analytics processing...")
     analytics_result = run_analytics()
-    
+
     if analytics_result != 0:
         print("Analytics processing failed. Aborting.")
         return analytics_result
-    
+
     print("Analytics processing completed successfully.")
-    
-    # Step 2: Check if email should be sent
-    print("\n[2/2] Checking email service...")
-    
-    if args.force_email:
-        print("Force email flag set - sending email regardless of interval.")
-        email_result = run_email_service()
-    else:
-        # Load email config to check timing
-        email_config = load_email_config()
-        
-        if should_send_email(email_config):
-            print("24-hour interval reached - sending analytics email.")
-            email_result = run_email_service()
-        else:
-            print("24-hour interval not reached - skipping email.")
-            email_result = 0
-    
+
+    # Step 2: Send the analytics email
+    print("\n[2/2] Sending analytics email...")
+    email_result = run_email_service()
+
     if email_result == 0:
         print("\nProduction service completed successfully.")
     else: